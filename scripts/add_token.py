@@ -11,6 +11,7 @@ import json
 import sys
 from pathlib import Path
 
+from utils.tokens import write_text_atomic
 from utils.web3 import (
     fetch_token_data_with_retry,
     get_web3_connection,
@@ -58,9 +59,7 @@ def create_token_directory(mainnet_dir: Path, token_data: dict) -> Path:
     token_dir.mkdir(parents=True, exist_ok=False)
 
     data_file = token_dir / "data.json"
-    with data_file.open("w", encoding="utf-8") as f:
-        json.dump(token_data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    write_text_atomic(data_file, json.dumps(token_data, indent=2, ensure_ascii=False) + "\n")
 
     return token_dir
 
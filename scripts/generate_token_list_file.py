@@ -9,92 +9,62 @@ Version numbers are automatically incremented based on changes:
 - Patch: any other changes
 """
 
+import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-import json5
+from utils.tokens import (
+    DATA_DIR,
+    REPO_RAW_URL,
+    ROOT_DIR,
+    find_logo_file,
+    get_data_directory,
+    get_token_dirs,
+    iter_tokens,
+    load_json,
+    write_text_atomic,
+)
 
-DATA_DIR = "mainnet"
 OUTPUT_FILE = "tokenlist-mainnet.json"
 TOKEN_LIST_NAME = "Monad Mainnet"
-LOGO_URI = (
-    "https://raw.githubusercontent.com/monad-crypto/token-list/refs/heads/main/assets/monad.svg"
-)
+LOGO_URI = f"{REPO_RAW_URL}assets/monad.svg"
 KEYWORDS = ["monad mainnet"]
 DEFAULT_VERSION_MAJOR = 1
 DEFAULT_VERSION_MINOR = 0
 DEFAULT_VERSION_PATCH = 0
 
 
-def get_data_directory() -> Path:
-    """Get the path to the data directory.
+def get_output_path() -> Path:
+    """Get the path to the generated token list file.
 
     Returns:
-        Path: Absolute path to the data directory.
-
-    Raises:
-        FileNotFoundError: If the data directory does not exist.
+        Path: Absolute path to the token list file.
     """
-    script_dir = Path(__file__).resolve().parent
-    data_dir = script_dir.parent / DATA_DIR
+    return ROOT_DIR / OUTPUT_FILE
 
-    if not data_dir.is_dir():
-        raise FileNotFoundError(f"Data directory not found: {data_dir}")
 
-    return data_dir
-
-
-def get_token_dirs(data_dir: Path) -> list[Path]:
-    """Get all token directories from the specified directory.
-
-    Args:
-        data_dir: Path to the directory containing token directories.
-
-    Returns:
-        list[Path]: Sorted list of token directory paths.
-    """
-    return [f for f in sorted(data_dir.iterdir()) if f.is_dir()]
-
-
-def load_token_data(dir_path: Path) -> dict[str, Any]:
-    """Load token data from a directory containing data.json and optional logo file.
+def build_token_entry(dir_path: Path, token_data: dict[str, Any]) -> dict[str, Any]:
+    """Build the token list entry for a token directory.
 
     Args:
         dir_path: Path to the token directory.
+        token_data: Token data loaded from the directory's data.json.
 
     Returns:
         dict: Token data as a dictionary. If a logo file (logo.svg or logo.png)
               exists in the directory, a logoURI field is added.
-
-    Raises:
-        ValueError: If the file cannot be parsed.
-        OSError: If the file cannot be read.
     """
-    try:
-        filepath = dir_path / "data.json"
-        with filepath.open(mode="r", encoding="utf-8") as f:
-            token_data = json5.load(f)
-
-            logo_uri = None
-            for logo_filename in ["logo.svg", "logo.png"]:
-                logo_path = dir_path / logo_filename
-                if logo_path.exists():
-                    logo_uri = logo_path
-                    break
-
-            if logo_uri:
-                root_dir = Path(__file__).resolve().parent.parent
-                token_data["logoURI"] = (
-                    f"https://raw.githubusercontent.com/monad-crypto/token-list/refs/heads/main/{logo_uri.relative_to(root_dir)}"
-                )
-
-            return token_data
-    except ValueError as e:
-        raise ValueError(f"Invalid JSON5 in {filepath}: {e}") from e
-    except OSError as e:
-        raise OSError(f"Cannot read {filepath}: {e}") from e
+    logo_path = find_logo_file(dir_path)
+
+    if logo_path:
+        return {
+            **token_data,
+            "logoURI": f"{REPO_RAW_URL}{logo_path.relative_to(ROOT_DIR)}",
+        }
+
+    return token_data
 
 
 def load_all_tokens(token_dirs: list[Path]) -> list[dict[str, Any]]:
@@ -110,7 +80,7 @@ def load_all_tokens(token_dirs: list[Path]) -> list[dict[str, Any]]:
         ValueError: If any token file cannot be parsed.
         IOError: If any token file cannot be read.
     """
-    return [load_token_data(dir_path) for dir_path in token_dirs]
+    return [build_token_entry(dir_path, data) for dir_path, data in iter_tokens(token_dirs)]
 
 
 def load_existing_token_list(output_path: Path) -> Optional[dict[str, Any]]:
@@ -126,8 +96,7 @@ def load_existing_token_list(output_path: Path) -> Optional[dict[str, Any]]:
         return None
 
     try:
-        with output_path.open(mode="r", encoding="utf-8") as f:
-            return json5.load(f)
+        return load_json(output_path)
     except (OSError, ValueError):
         return None
 
@@ -148,6 +117,10 @@ def compare_tokens(
             - "minor": Tokens added
             - "patch": Other changes (metadata, logoURI, etc.)
     """
+    # Unchanged lists are the common case, so skip the per-token comparison
+    if old_tokens == new_tokens:
+        return (None, None)
+
     old_map = {t["symbol"]: t for t in old_tokens}
     new_map = {t["symbol"]: t for t in new_tokens}
 
@@ -227,7 +200,10 @@ def create_token_list(
 
 
 def write_token_list(token_list: dict[str, Any], output_path: Path) -> None:
-    """Write the token list to a JSON5 file.
+    """Write the token list to a JSON file.
+
+    The list is serialized in one go and written to a temporary file that then
+    replaces the output file, so readers never see a partially written list.
 
     Args:
         token_list: The token list data structure.
@@ -237,14 +213,7 @@ def write_token_list(token_list: dict[str, Any], output_path: Path) -> None:
         IOError: If the file cannot be written.
     """
     try:
-        with output_path.open(mode="w", encoding="utf-8") as f:
-            json5.dump(
-                token_list,
-                f,
-                indent=2,
-                quote_keys=True,
-                trailing_commas=False,
-            )
+        write_text_atomic(output_path, json.dumps(token_list, indent=2))
     except OSError as e:
         raise OSError(f"Cannot write to {output_path}: {e}") from e
 
@@ -261,6 +230,55 @@ def format_version(version: dict[str, int]) -> str:
     return f"{version['major']}.{version['minor']}.{version['patch']}"
 
 
+def generate_token_list(new_tokens: list[dict[str, Any]], output_path: Path) -> None:
+    """Write the token list, bumping its version if the tokens changed.
+
+    Args:
+        new_tokens: List of token list entries.
+        output_path: Path of the token list file.
+
+    Raises:
+        IOError: If the file cannot be written.
+    """
+    existing_token_list = load_existing_token_list(output_path)
+
+    if existing_token_list:
+        # Compare with existing token list
+        change_type, change_description = compare_tokens(
+            existing_token_list.get("tokens", []), new_tokens
+        )
+        old_version = existing_token_list["version"]
+
+        if change_type is None:
+            print("No changes detected. Token list remains unchanged.")
+            print(f"   - Current version: {format_version(old_version)}")
+            return
+
+        new_version = increment_version(existing_token_list["version"], change_type)
+
+        print(f"Changes detected: {change_description}")
+        print(f"   - Change type: {change_type}")
+        print(f"   - Version: {format_version(old_version)} -> {format_version(new_version)}")
+    else:
+        # First time generation
+        new_version = {
+            "major": DEFAULT_VERSION_MAJOR,
+            "minor": DEFAULT_VERSION_MINOR,
+            "patch": DEFAULT_VERSION_PATCH,
+        }
+        print("Generating token list for the first time...")
+
+    # The timestamp only changes when the token list is actually rewritten
+    new_timestamp = datetime.now(timezone.utc).isoformat()
+    token_list = create_token_list(new_tokens, new_version, new_timestamp)
+    write_token_list(token_list, output_path)
+
+    print(f"Successfully created '{OUTPUT_FILE}'")
+    print(f"   - {len(new_tokens)} token(s) included")
+    print(f"   - Timestamp: {token_list['timestamp']}")
+    print(f"   - Version: {format_version(new_version)}")
+
+
 def main() -> int:
     """Main entry point for the token list generator.
 
@@ -269,7 +287,6 @@ def main() -> int:
     """
     try:
         data_dir = get_data_directory()
-        output_path = Path(__file__).resolve().parent.parent / OUTPUT_FILE
 
         token_dirs = get_token_dirs(data_dir)
         if not token_dirs:
@@ -278,44 +295,8 @@ def main() -> int:
 
         print(f"Processing {len(token_dirs)} token(s)...")
 
-        existing_token_list = load_existing_token_list(output_path)
         new_tokens = load_all_tokens(token_dirs)
-
-        if existing_token_list:
-            # Compare with existing token list
-            change_type, change_description = compare_tokens(
-                existing_token_list.get("tokens", []), new_tokens
-            )
-            old_version = existing_token_list["version"]
-
-            if change_type is None:
-                print("No changes detected. Token list remains unchanged.")
-                print(f"   - Current version: {format_version(old_version)}")
-                return 0
-
-            new_version = increment_version(existing_token_list["version"], change_type)
-            new_timestamp = datetime.now(timezone.utc).isoformat()
-
-            print(f"Changes detected: {change_description}")
-            print(f"   - Change type: {change_type}")
-            print(f"   - Version: {format_version(old_version)} -> {format_version(new_version)}")
-        else:
-            # First time generation
-            new_version = {
-                "major": DEFAULT_VERSION_MAJOR,
-                "minor": DEFAULT_VERSION_MINOR,
-                "patch": DEFAULT_VERSION_PATCH,
-            }
-            new_timestamp = datetime.now(timezone.utc).isoformat()
-            print("Generating token list for the first time...")
-
-        token_list = create_token_list(new_tokens, new_version, new_timestamp)
-        write_token_list(token_list, output_path)
-
-        print(f"Successfully created '{OUTPUT_FILE}'")
-        print(f"   - {len(new_tokens)} token(s) included")
-        print(f"   - Timestamp: {token_list['timestamp']}")
-        print(f"   - Version: {format_version(new_version)}")
+        generate_token_list(new_tokens, get_output_path())
 
         return 0
     except FileNotFoundError as e:
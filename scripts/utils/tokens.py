@@ -0,0 +1,155 @@
+"""Utilities for reading token definition files.
+
+This module provides helpers shared by the scripts that read token data
+from the mainnet/ directory, so that each data.json file is located and
+parsed the same way everywhere.
+"""
+
+import json
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Optional
+
+import json5
+
+DATA_DIR = "mainnet"
+TOKEN_DATA_FILE = "data.json"
+LOGO_FILENAMES = ("logo.svg", "logo.png")  # in order of preference
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+# Base URL under which files in this repository are published
+REPO_RAW_URL = "https://raw.githubusercontent.com/monad-crypto/token-list/refs/heads/main/"
+
+
+def get_data_directory() -> Path:
+    """Get the path to the data directory.
+
+    Returns:
+        Path: Absolute path to the data directory.
+
+    Raises:
+        FileNotFoundError: If the data directory does not exist.
+    """
+    data_dir = ROOT_DIR / DATA_DIR
+
+    if not data_dir.is_dir():
+        raise FileNotFoundError(f"Data directory not found: {data_dir}")
+
+    return data_dir
+
+
+def get_token_dirs(data_dir: Path) -> list[Path]:
+    """Get all token directories from the specified directory.
+
+    Args:
+        data_dir: Path to the directory containing token directories.
+
+    Returns:
+        list[Path]: Sorted list of token directory paths.
+    """
+    # scandir reports the entry type with the listing, avoiding a stat per entry
+    with os.scandir(data_dir) as entries:
+        return sorted(Path(entry.path) for entry in entries if entry.is_dir())
+
+
+def load_json(path: Path) -> Any:
+    """Load a JSON file, falling back to JSON5 for non-strict input.
+
+    Strict JSON is parsed with the standard library's C parser, which is much
+    faster than json5's pure-Python parser. Files using JSON5 syntax (comments,
+    trailing commas, etc.) are still accepted.
+
+    Args:
+        path: Path to the file to load.
+
+    Returns:
+        Any: The parsed file contents.
+
+    Raises:
+        ValueError: If the file is neither valid JSON nor valid JSON5.
+        OSError: If the file cannot be read.
+    """
+    text = path.read_text(encoding="utf-8")
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json5.loads(text)
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write a text file in a single write, atomically replacing any existing file.
+
+    The text is written to a temporary file next to the target which is then
+    renamed over it, so readers never see a partially written file.
+
+    Args:
+        path: Path of the file to write.
+        text: Contents of the file.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def load_token_data(dir_path: Path) -> dict[str, Any]:
+    """Load the data.json file of a token directory.
+
+    Args:
+        dir_path: Path to the token directory.
+
+    Returns:
+        dict: Token data as a dictionary.
+
+    Raises:
+        ValueError: If the file cannot be parsed.
+        OSError: If the file cannot be read.
+    """
+    return load_json(dir_path / TOKEN_DATA_FILE)
+
+
+def find_logo_file(dir_path: Path) -> Optional[Path]:
+    """Find the logo file of a token directory.
+
+    Args:
+        dir_path: Path to the token directory.
+
+    Returns:
+        Optional[Path]: Path to the first logo file found, or None if there is none.
+    """
+    for logo_filename in LOGO_FILENAMES:
+        logo_path = dir_path / logo_filename
+        if logo_path.is_file():
+            return logo_path
+    return None
+
+
+def iter_tokens(token_dirs: Iterable[Path]) -> Iterator[tuple[Path, dict[str, Any]]]:
+    """Load the token data of each directory, parsing every file exactly once.
+
+    Args:
+        token_dirs: Token directory paths.
+
+    Yields:
+        tuple[Path, dict]: (token directory, token data)
+
+    Raises:
+        ValueError: If any token file cannot be parsed.
+        OSError: If any token file cannot be read.
+    """
+    for dir_path in token_dirs:
+        filepath = dir_path / TOKEN_DATA_FILE
+        try:
+            token_data = load_token_data(dir_path)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON5 in {filepath}: {e}") from e
+        except OSError as e:
+            raise OSError(f"Cannot read {filepath}: {e}") from e
+
+        yield dir_path, token_data
@@ -5,43 +5,177 @@ ERC20 token metadata with retry logic.
 """
 
 import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache, lru_cache, partial
 from typing import Optional
 
+import requests
+from eth_abi.exceptions import DecodingError
+from requests.adapters import HTTPAdapter
 from web3 import Web3
-from web3.exceptions import Web3Exception
+from web3.contract import Contract
+from web3.exceptions import (
+    BadFunctionCallOutput,
+    ContractLogicError,
+    ProviderConnectionError,
+    Web3Exception,
+)
 
 CHAIN_ID = 143
 DEFAULT_RPC_URL = "https://rpc.monad.xyz"
 RPC_URL = os.environ.get("MONAD_RPC_URL", DEFAULT_RPC_URL)
-ERC20_ABI = [
-    {
-        "constant": True,
-        "inputs": [],
-        "name": "name",
-        "outputs": [{"name": "", "type": "string"}],
-        "type": "function",
-    },
-    {
-        "constant": True,
-        "inputs": [],
-        "name": "symbol",
-        "outputs": [{"name": "", "type": "string"}],
-        "type": "function",
-    },
+RPC_TIMEOUT = (3, 10)  # (connect, read) timeouts in seconds
+RPC_POOL_CONNECTIONS = 8
+RPC_POOL_MAXSIZE = 32  # enough for concurrent token validation
+
+# Multicall3 is deployed at the same address on every chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
     {
-        "constant": True,
-        "inputs": [],
-        "name": "decimals",
-        "outputs": [{"name": "", "type": "uint8"}],
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
         "type": "function",
     },
 ]
 
+# Field -> (calldata, ABI return type) for each ERC20 metadata getter. The getters
+# take no arguments, so their calldata is just the function selector.
+ERC20_METADATA_CALLS = {
+    "name": (Web3.keccak(text="name()")[:4], "string"),
+    "symbol": (Web3.keccak(text="symbol()")[:4], "string"),
+    "decimals": (Web3.keccak(text="decimals()")[:4], "uint8"),
+}
+
 # Retry configuration
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0  # seconds
 DEFAULT_RETRY_BACKOFF = 2.0  # exponential backoff multiplier
+DEFAULT_RETRY_JITTER = 0.2  # max random delay added, as a fraction of the current delay
+DEFAULT_RETRY_MAX_DELAY = 30.0  # seconds
+CONNECT_MAX_RETRIES = 2
+CONNECT_RETRY_DELAY = 0.5  # seconds
+# Transient RPC/transport errors worth retrying; anything else is raised immediately
+RETRYABLE_EXCEPTIONS = (
+    Web3Exception,
+    requests.exceptions.RequestException,
+    TimeoutError,
+    ConnectionError,
+)
+# Errors meaning the RPC could not be reached; only these count against the breaker
+RPC_TRANSPORT_EXCEPTIONS = (
+    requests.exceptions.RequestException,
+    TimeoutError,
+    ConnectionError,
+    ProviderConnectionError,
+)
+# Errors returned by a reachable node for a specific call (revert, no contract code);
+# these are never retried
+RPC_CALL_EXCEPTIONS = (ContractLogicError, BadFunctionCallOutput)
+
+# Circuit breaker configuration
+DEFAULT_FAILURE_THRESHOLD = 5  # consecutive failures before the breaker opens
+DEFAULT_RESET_TIMEOUT = 30.0  # seconds before an open breaker allows a probe call
+
+
+class CircuitBreakerOpenError(Exception):
+    """Raised when an RPC call is rejected because the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Circuit breaker that fails fast while the RPC is unavailable.
+
+    The breaker opens after ``failure_threshold`` consecutive failures and rejects
+    calls for ``reset_timeout`` seconds. It then moves to half-open and lets a
+    single probe call through, rejecting other calls until the probe resolves: a
+    success closes the breaker, a failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_thread = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check whether a call may be attempted.
+
+        Returns:
+            bool: False if the breaker is open or a half-open probe is in flight,
+                True otherwise.
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN:
+                if self._probe_thread is not None:
+                    return False
+                self._probe_thread = threading.get_ident()
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call and close the breaker."""
+        with self._lock:
+            self._failures = 0
+            self._probe_thread = None
+            self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker if the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            self._probe_thread = None
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """End a call that says nothing about the RPC's health.
+
+        If the call was the half-open probe, the next caller may probe instead.
+        """
+        with self._lock:
+            if self._probe_thread == threading.get_ident():
+                self._probe_thread = None
+
+
+RPC_CIRCUIT_BREAKER = CircuitBreaker()
 
 
 def _retry_with_backoff(
@@ -50,42 +184,95 @@ def _retry_with_backoff(
     retry_delay: float,
     retry_backoff: float,
     operation_name: str,
+    *,
+    jitter_factor: float = DEFAULT_RETRY_JITTER,
+    max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+    retry_on: tuple[type[Exception], ...] = RETRYABLE_EXCEPTIONS,
 ):
     """Execute a function with retry logic and exponential backoff.
 
+    A random jitter is added to each delay so that concurrent callers don't
+    retry against the RPC in lockstep. Attempts are rejected immediately while
+    the RPC circuit breaker is open.
+
     Args:
         func: Callable to execute (should raise exception on failure).
         max_retries: Maximum number of retry attempts.
         retry_delay: Initial delay between retries in seconds.
         retry_backoff: Multiplier for exponential backoff.
         operation_name: Name of the operation for error messages.
+        jitter_factor: Maximum jitter as a fraction of the current delay.
+        max_delay: Upper bound for the delay between retries in seconds.
+        retry_on: Exception types that trigger a retry. Other exceptions, as well
+            as reverts and empty call results, are raised immediately.
 
     Returns:
         The return value of the successful function call.
 
     Raises:
+        CircuitBreakerOpenError: If the RPC circuit breaker is open.
+        ContractLogicError: If the call reverts.
+        BadFunctionCallOutput: If the call returns no data.
         Exception: If all retries fail.
     """
     current_delay = retry_delay
     last_exception = None
 
     for attempt in range(max_retries):
+        if not RPC_CIRCUIT_BREAKER.allow():
+            raise CircuitBreakerOpenError(
+                f"Failed to {operation_name}: RPC circuit breaker is open"
+            ) from last_exception
         try:
-            return func()
-        except (Web3Exception, Exception) as e:
+            result = func()
+        except RPC_CALL_EXCEPTIONS:
+            # The node answered and would answer the same way again, so don't retry;
+            # it doesn't count against the RPC either
+            RPC_CIRCUIT_BREAKER.record_success()
+            raise
+        except retry_on as e:
+            if isinstance(e, RPC_TRANSPORT_EXCEPTIONS):
+                RPC_CIRCUIT_BREAKER.record_failure()
+            else:
+                RPC_CIRCUIT_BREAKER.release()
             last_exception = e
             if attempt < max_retries - 1:
-                time.sleep(current_delay)
-                current_delay *= retry_backoff
+                time.sleep(current_delay + random.uniform(0, jitter_factor * current_delay))
+                current_delay = min(current_delay * retry_backoff, max_delay)
             continue
+        except BaseException:
+            RPC_CIRCUIT_BREAKER.release()
+            raise
+        RPC_CIRCUIT_BREAKER.record_success()
+        return result
     raise Exception(
         f"Failed to {operation_name} after {max_retries} attempts: {last_exception}"
     ) from last_exception
 
 
+def _create_rpc_session() -> requests.Session:
+    """Create an HTTP session that keeps connections to the RPC alive.
+
+    Returns:
+        requests.Session: Session with a connection pool sized for concurrent calls.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=RPC_POOL_CONNECTIONS,
+        pool_maxsize=RPC_POOL_MAXSIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def get_web3_connection(rpc_url: Optional[str] = None) -> Web3:
     """Get a Web3 connection to the blockchain.
 
+    The connection check is retried briefly, and every request is bounded by
+    connect and read timeouts so that an unresponsive RPC can't stall the caller.
+
     Args:
         rpc_url: Optional RPC URL. If not provided, uses RPC_URL constant.
 
@@ -96,10 +283,27 @@ def get_web3_connection(rpc_url: Optional[str] = None) -> Web3:
         ConnectionError: If unable to connect to the RPC.
     """
     url = rpc_url or RPC_URL
-    web3 = Web3(Web3.HTTPProvider(url))
+    web3 = Web3(
+        Web3.HTTPProvider(
+            url,
+            request_kwargs={"timeout": RPC_TIMEOUT},
+            # Shared by all threads, so they reuse one pool (web3 >= 7.14.1)
+            session=_create_rpc_session(),
+            # Retries are handled by _retry_with_backoff and its circuit breaker
+            exception_retry_configuration=None,
+        )
+    )
 
-    if not web3.is_connected():
-        raise ConnectionError(f"Failed to connect to RPC at {url}")
+    try:
+        _retry_with_backoff(
+            lambda: web3.is_connected(show_traceback=True),
+            CONNECT_MAX_RETRIES,
+            CONNECT_RETRY_DELAY,
+            DEFAULT_RETRY_BACKOFF,
+            f"connect to RPC at {url}",
+        )
+    except Exception as e:
+        raise ConnectionError(f"Failed to connect to RPC at {url}") from e
 
     return web3
 
@@ -116,22 +320,85 @@ def validate_address(address: str) -> str:
     Raises:
         ValueError: If the address is invalid.
     """
-    if not Web3.is_address(address):
+    checksum_address = _to_checksum_address(address)
+    if checksum_address is None:
         raise ValueError(f"Invalid Ethereum address: {address}")
 
+    return checksum_address
+
+
+@lru_cache(maxsize=4096)
+def _to_checksum_address(address: str) -> Optional[str]:
+    """Get the checksummed form of an address.
+
+    Checksumming hashes the address with keccak256, so results are cached for
+    addresses that are validated more than once.
+
+    Args:
+        address: The address string to convert.
+
+    Returns:
+        Optional[str]: Checksummed address, or None if the address is invalid.
+    """
+    if not Web3.is_address(address):
+        return None
+
     return Web3.to_checksum_address(address)
 
 
+def _fetch_token_field(web3: Web3, address: str, field: str):
+    """Fetch a single ERC20 metadata field with a raw eth_call.
+
+    The calldata is prebuilt, so no ABI encoding happens per call.
+
+    Args:
+        web3: Web3 instance connected to the chain.
+        address: Token contract address (should be checksummed).
+        field: Metadata field to fetch (name, symbol or decimals).
+
+    Returns:
+        The decoded field value.
+
+    Raises:
+        BadFunctionCallOutput: If the call returns no data.
+    """
+    calldata, return_type = ERC20_METADATA_CALLS[field]
+    return_data = web3.eth.call({"to": address, "data": calldata})
+
+    if not return_data:
+        raise BadFunctionCallOutput(f"{field}() returned no data, is {address} a contract?")
+
+    return web3.codec.decode([return_type], return_data)[0]
+
+
+@cache
+def _get_multicall_contract(web3: Web3) -> Contract:
+    """Get a cached Multicall3 contract object.
+
+    Args:
+        web3: Web3 instance connected to the chain.
+
+    Returns:
+        Contract: Multicall3 contract.
+    """
+    return web3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+
 def fetch_token_data_with_retry(
     web3: Web3,
     address: str,
     max_retries: int = DEFAULT_MAX_RETRIES,
     retry_delay: float = DEFAULT_RETRY_DELAY,
     retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    *,
+    jitter_factor: float = DEFAULT_RETRY_JITTER,
 ) -> dict:
     """Fetch token data from the blockchain with retry logic.
 
-    Fetches each field separately to avoid redundant retries if only one field fails.
+    All fields are first fetched in a single Multicall3 call. If that call reverts
+    (e.g. one of the getters reverts) or its results can't be decoded, the fields
+    are fetched concurrently, each with its own retries to avoid redundant retries
+    if only one field fails.
 
     Args:
         web3: Web3 instance connected to the chain.
@@ -139,6 +406,7 @@ def fetch_token_data_with_retry(
         max_retries: Maximum number of retry attempts.
         retry_delay: Initial delay between retries in seconds.
         retry_backoff: Multiplier for exponential backoff.
+        jitter_factor: Maximum retry jitter as a fraction of the current delay.
 
     Returns:
         dict: Token data containing chainId, address, name, symbol, and decimals.
@@ -146,18 +414,64 @@ def fetch_token_data_with_retry(
     Raises:
         Exception: If fetching any token field fails after all retries.
     """
-    name = fetch_token_name_with_retry(web3, address, max_retries, retry_delay, retry_backoff)
-    symbol = fetch_token_symbol_with_retry(web3, address, max_retries, retry_delay, retry_backoff)
-    decimals = fetch_token_decimals_with_retry(
-        web3, address, max_retries, retry_delay, retry_backoff
-    )
+    try:
+        fields = _retry_with_backoff(
+            partial(_fetch_token_metadata_multicall, web3, address),
+            max_retries,
+            retry_delay,
+            retry_backoff,
+            "fetch token metadata",
+            jitter_factor=jitter_factor,
+        )
+    except (ContractLogicError, BadFunctionCallOutput, DecodingError):
+        with ThreadPoolExecutor(max_workers=len(ERC20_METADATA_CALLS)) as executor:
+            futures = {
+                executor.submit(
+                    _retry_with_backoff,
+                    partial(_fetch_token_field, web3, address, field),
+                    max_retries,
+                    retry_delay,
+                    retry_backoff,
+                    f"fetch {field}",
+                    jitter_factor=jitter_factor,
+                ): field
+                for field in ERC20_METADATA_CALLS
+            }
+            fields = {futures[future]: future.result() for future in as_completed(futures)}
 
     return {
         "chainId": CHAIN_ID,
         "address": address,
-        "name": name,
-        "symbol": symbol,
-        "decimals": decimals,
+        "name": fields["name"],
+        "symbol": fields["symbol"],
+        "decimals": fields["decimals"],
+    }
+
+
+def _fetch_token_metadata_multicall(web3: Web3, address: str) -> dict:
+    """Fetch token name, symbol and decimals in a single call via Multicall3.
+
+    Args:
+        web3: Web3 instance connected to the chain.
+        address: Token contract address (should be checksummed).
+
+    Returns:
+        dict: Mapping of field name to decoded on-chain value.
+
+    Raises:
+        ContractLogicError: If the aggregate call reverts.
+        BadFunctionCallOutput: If Multicall3 returns no data.
+        DecodingError: If a result cannot be decoded.
+    """
+    multicall = _get_multicall_contract(web3)
+    calls = [(address, False, calldata) for calldata, _ in ERC20_METADATA_CALLS.values()]
+    results = multicall.functions.aggregate3(calls).call()
+
+    return {
+        field: web3.codec.decode([return_type], return_data)[0]
+        for (field, (_, return_type)), (_, return_data) in zip(
+            ERC20_METADATA_CALLS.items(), results
+        )
     }
 
 
@@ -167,6 +481,8 @@ def fetch_token_name_with_retry(
     max_retries: int = DEFAULT_MAX_RETRIES,
     retry_delay: float = DEFAULT_RETRY_DELAY,
     retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    *,
+    jitter_factor: float = DEFAULT_RETRY_JITTER,
 ) -> str:
     """Fetch token name from the blockchain with retry logic.
 
@@ -176,6 +492,7 @@ def fetch_token_name_with_retry(
         max_retries: Maximum number of retry attempts.
         retry_delay: Initial delay between retries in seconds.
         retry_backoff: Multiplier for exponential backoff.
+        jitter_factor: Maximum retry jitter as a fraction of the current delay.
 
     Returns:
         str: Token name.
@@ -183,13 +500,13 @@ def fetch_token_name_with_retry(
     Raises:
         Exception: If fetching the name fails after all retries.
     """
-    contract = web3.eth.contract(address=address, abi=ERC20_ABI)
     return _retry_with_backoff(
-        lambda: contract.functions.name().call(),
+        lambda: _fetch_token_field(web3, address, "name"),
         max_retries,
         retry_delay,
         retry_backoff,
         "fetch name",
+        jitter_factor=jitter_factor,
     )
 
 
@@ -199,6 +516,8 @@ def fetch_token_symbol_with_retry(
     max_retries: int = DEFAULT_MAX_RETRIES,
     retry_delay: float = DEFAULT_RETRY_DELAY,
     retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    *,
+    jitter_factor: float = DEFAULT_RETRY_JITTER,
 ) -> str:
     """Fetch token symbol from the blockchain with retry logic.
 
@@ -208,6 +527,7 @@ def fetch_token_symbol_with_retry(
         max_retries: Maximum number of retry attempts.
         retry_delay: Initial delay between retries in seconds.
         retry_backoff: Multiplier for exponential backoff.
+        jitter_factor: Maximum retry jitter as a fraction of the current delay.
 
     Returns:
         str: Token symbol.
@@ -215,13 +535,13 @@ def fetch_token_symbol_with_retry(
     Raises:
         Exception: If fetching the symbol fails after all retries.
     """
-    contract = web3.eth.contract(address=address, abi=ERC20_ABI)
     return _retry_with_backoff(
-        lambda: contract.functions.symbol().call(),
+        lambda: _fetch_token_field(web3, address, "symbol"),
         max_retries,
         retry_delay,
         retry_backoff,
         "fetch symbol",
+        jitter_factor=jitter_factor,
     )
 
 
@@ -231,6 +551,8 @@ def fetch_token_decimals_with_retry(
     max_retries: int = DEFAULT_MAX_RETRIES,
     retry_delay: float = DEFAULT_RETRY_DELAY,
     retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    *,
+    jitter_factor: float = DEFAULT_RETRY_JITTER,
 ) -> int:
     """Fetch token decimals from the blockchain with retry logic.
 
@@ -240,6 +562,7 @@ def fetch_token_decimals_with_retry(
         max_retries: Maximum number of retry attempts.
         retry_delay: Initial delay between retries in seconds.
         retry_backoff: Multiplier for exponential backoff.
+        jitter_factor: Maximum retry jitter as a fraction of the current delay.
 
     Returns:
         int: Token decimals.
@@ -247,11 +570,11 @@ def fetch_token_decimals_with_retry(
     Raises:
         Exception: If fetching the decimals fails after all retries.
     """
-    contract = web3.eth.contract(address=address, abi=ERC20_ABI)
     return _retry_with_backoff(
-        lambda: contract.functions.decimals().call(),
+        lambda: _fetch_token_field(web3, address, "decimals"),
         max_retries,
         retry_delay,
         retry_backoff,
         "fetch decimals",
+        jitter_factor=jitter_factor,
     )
@@ -9,10 +9,19 @@ It also validates that the token metadata matches on-chain data.
 import argparse
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Any
-
-import json5
+from typing import Any, Optional
+
+from generate_token_list_file import build_token_entry, generate_token_list, get_output_path
+from utils.tokens import (
+    DATA_DIR,
+    TOKEN_DATA_FILE,
+    get_data_directory,
+    get_token_dirs,
+    load_token_data,
+)
 from utils.web3 import (
     DEFAULT_RPC_URL,
     fetch_token_decimals_with_retry,
@@ -22,8 +31,8 @@ from utils.web3 import (
 )
 from web3 import Web3
 
-DATA_DIR = "mainnet"
 REQUIRED_FIELDS = ["chainId", "address", "name", "symbol", "decimals"]
+REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
 ALLOWED_EXTENSIONS = {
     "coinGeckoId": str,
 }
@@ -31,36 +40,8 @@ EXPECTED_CHAIN_ID = 143
 MIN_DECIMALS = 0
 MAX_DECIMALS = 36
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
-
-
-def get_data_directory() -> Path:
-    """Get the path to the data directory.
-
-    Returns:
-        Path: Absolute path to the data directory.
-
-    Raises:
-        FileNotFoundError: If the data directory does not exist.
-    """
-    script_dir = Path(__file__).resolve().parent
-    data_dir = script_dir.parent / DATA_DIR
-
-    if not data_dir.is_dir():
-        raise FileNotFoundError(f"Data directory not found: {data_dir}")
-
-    return data_dir
-
-
-def get_token_dirs(data_dir: Path) -> list[Path]:
-    """Get all token directories from the specified directory.
-
-    Args:
-        data_dir: Path to the directory containing token directories.
-
-    Returns:
-        list[Path]: Sorted list of token directory paths.
-    """
-    return [f for f in sorted(data_dir.iterdir()) if f.is_dir()]
+ADDRESS_PATTERN = re.compile(r"0x[0-9A-Fa-f]{40}")
+DEFAULT_MAX_WORKERS = 16  # token directories validated concurrently
 
 
 def is_valid_address(address: str) -> bool:
@@ -72,7 +53,7 @@ def is_valid_address(address: str) -> bool:
     Returns:
         bool: True if the address is valid, False otherwise.
     """
-    return bool(re.match(r"^0x[0-9A-Fa-f]{40}$", address))
+    return isinstance(address, str) and ADDRESS_PATTERN.fullmatch(address) is not None
 
 
 def validate_token_data(
@@ -82,20 +63,42 @@ def validate_token_data(
 ) -> list[str]:
     """Validate token data against required schema and on-chain metadata.
 
+    On-chain metadata is only fetched once the data passes the schema checks,
+    so malformed token files don't cost any RPC round-trips.
+
     Args:
         data: The token data dictionary to validate.
         token_dir_name: Name of the token directory (should match symbol).
         web3: Web3 instance for on-chain validation.
 
+    Returns:
+        list[str]: List of error messages. Empty list if validation passes.
+    """
+    errors = validate_token_schema(data, token_dir_name)
+    if errors:
+        return errors
+
+    return validate_onchain_metadata(data, web3)
+
+
+def validate_token_schema(data: dict[str, Any], token_dir_name: str) -> list[str]:
+    """Validate token data against the required schema.
+
+    Args:
+        data: The token data dictionary to validate.
+        token_dir_name: Name of the token directory (should match symbol).
+
     Returns:
         list[str]: List of error messages. Empty list if validation passes.
     """
     errors = []
 
     # Check for required fields
-    missing_fields = [field for field in REQUIRED_FIELDS if field not in data]
+    missing_fields = REQUIRED_FIELD_SET.difference(data)
     if missing_fields:
-        errors.append(f"Missing required fields: {', '.join(missing_fields)}")
+        # Report in schema order so the message is stable
+        missing = [field for field in REQUIRED_FIELDS if field in missing_fields]
+        errors.append(f"Missing required fields: {', '.join(missing)}")
         return errors
 
     # Validate chainId
@@ -148,10 +151,6 @@ def validate_token_data(
                 else:
                     errors.append(f"Invalid extension tag: {tag}. Allowed tags are: {allowed_tags}")
 
-    # Validate on-chain data
-    onchain_errors = validate_onchain_metadata(data, web3)
-    errors.extend(onchain_errors)
-
     return errors
 
 
@@ -210,7 +209,7 @@ def validate_onchain_metadata(data: dict[str, Any], web3: Web3) -> list[str]:
 def validate_token_directory(
     dir_path: Path,
     web3: Web3,
-) -> tuple[bool, list[str]]:
+) -> tuple[Optional[dict[str, Any]], list[str]]:
     """Validate a token directory and its data.json file.
 
     Args:
@@ -218,24 +217,44 @@ def validate_token_directory(
         web3: Web3 instance for on-chain validation.
 
     Returns:
-        tuple[bool, list[str]]: (is_valid, error_messages)
+        tuple[Optional[dict], list[str]]: (token_data, error_messages). token_data
+            is None if data.json cannot be loaded; the token is valid if there
+            are no error messages.
     """
     token_name = dir_path.name
-    data_file = dir_path / "data.json"
 
-    if not data_file.exists():
-        return False, [f"data.json not found in {token_name}/ directory"]
+    if not (dir_path / TOKEN_DATA_FILE).exists():
+        return None, [f"{TOKEN_DATA_FILE} not found in {token_name}/ directory"]
 
     try:
-        with data_file.open(mode="r", encoding="utf-8") as f:
-            data = json5.load(f)
+        data = load_token_data(dir_path)
     except ValueError as e:
-        return False, [f"Invalid JSON5 in data.json: {e}"]
+        return None, [f"Invalid JSON5 in {TOKEN_DATA_FILE}: {e}"]
     except OSError as e:
-        return False, [f"Cannot read data.json: {e}"]
+        return None, [f"Cannot read {TOKEN_DATA_FILE}: {e}"]
+
+    return data, validate_token_data(data, token_name, web3)
+
+
+def positive_int(value: str) -> int:
+    """Parse a command-line argument as a positive integer.
+
+    Args:
+        value: The argument string.
 
-    errors = validate_token_data(data, token_name, web3)
-    return len(errors) == 0, errors
+    Returns:
+        int: The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
 
 
 def main() -> int:
@@ -252,6 +271,17 @@ def main() -> int:
         type=str,
         help=f"Custom RPC URL (defaults to MONAD_RPC_URL env var or {DEFAULT_RPC_URL})",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=positive_int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of tokens validated concurrently (defaults to {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--generate",
+        action="store_true",
+        help="Also regenerate the token list from the validated token files in the same pass",
+    )
 
     args = parser.parse_args()
 
@@ -272,12 +302,15 @@ def main() -> int:
 
         print(f"Validating {len(token_dirs)} token(s)...\n")
 
+        # Validation is dominated by RPC round-trips, so tokens are checked concurrently
+        with ThreadPoolExecutor(max_workers=args.max_workers) as executor:
+            results = list(executor.map(validate_token_directory, token_dirs, repeat(web3)))
+
         all_valid = True
-        for dir_path in token_dirs:
+        for dir_path, (_, errors) in zip(token_dirs, results):
             token_name = dir_path.name
-            is_valid, errors = validate_token_directory(dir_path, web3)
 
-            if is_valid:
+            if not errors:
                 print(f"{token_name} is valid")
             else:
                 print(f"{token_name} is invalid:")
@@ -287,6 +320,16 @@ def main() -> int:
 
         if all_valid:
             print(f"\nAll {len(token_dirs)} token(s) are valid")
+
+            if args.generate:
+                # Reuse the token files parsed during validation
+                print()
+                new_tokens = [
+                    build_token_entry(dir_path, data)
+                    for dir_path, (data, _) in zip(token_dirs, results)
+                ]
+                generate_token_list(new_tokens, get_output_path())
+
             return 0
 
         print("\nValidation failed for one or more tokens")